@@ -38,7 +38,7 @@ class HtdConfigFlow(ConfigFlow, domain=DOMAIN):
         self, discovery_info: dhcp.DhcpServiceInfo
     ):
         """Handle dhcp discovery."""
-        _LOGGER.info("HTD device detected: %s %s" % (discovery_info.ip, self.port))
+        _LOGGER.info("HTD device detected: %s %s", discovery_info.ip, self.port)
         host = discovery_info.ip
         network_address = (host, self.port)
         model_info = await async_get_model_info(network_address=network_address)
@@ -46,7 +46,7 @@ class HtdConfigFlow(ConfigFlow, domain=DOMAIN):
         if model_info is None:
             return self.async_abort(reason="unknown_model")
 
-        _LOGGER.info("Model identified as: %s" % model_info)
+        _LOGGER.info("Model identified as: %s", model_info)
 
         unique_id = "htd-%s" % discovery_info.macaddress
 
@@ -1,8 +1,18 @@
 """Support for HTD"""
 
+import functools
 import logging
 import re
 import json
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 from homeassistant.components.media_player import MediaPlayerEntity
 from homeassistant.components.media_player.const import MediaPlayerEntityFeature
@@ -27,8 +37,15 @@ _LOGGER = logging.getLogger(__name__)
 
 type HtdClientConfigEntry = ConfigEntry[BaseClient]
 
-GENERIC_ZONE_NAMES = {i: f"Zone {i}" for i in range(1, 13)}
-GENERIC_SOURCE_NAMES = {i: f"Source {i}" for i in range(13, 20)}
+_EMPTY_MAPPING = MappingProxyType({})
+
+_POWER_STATES = (STATE_OFF, STATE_ON)
+_MAX_VOLUME = HtdConstants.MAX_VOLUME
+_INV_MAX_VOLUME = 1.0 / _MAX_VOLUME
+
+# tuple lookups for the hot property paths, index 0 is unused
+_GENERIC_ZONE_NAMES = tuple(sys.intern(f"Zone {i}") for i in range(13))
+_GENERIC_SOURCE_NAMES = tuple(sys.intern(f"Source {i}") for i in range(64))
 
 SUPPORT_HTD = (
     MediaPlayerEntityFeature.SELECT_SOURCE |
@@ -39,33 +56,161 @@ SUPPORT_HTD = (
     MediaPlayerEntityFeature.VOLUME_STEP
 )
 
-def make_alphanumeric(input_string):
-    temp = re.sub(r'[^a-zA-Z0-9]', '_', input_string)
-    return re.sub(r'_+', '_', temp).strip('_')
+_NONALNUM_RE = re.compile(r'[^a-zA-Z0-9]')
+_MULTI_UNDERSCORE_RE = re.compile(r'_+')
+# one "id=name" item of a comma-separated mapping, anchored to the start of an
+# item; the id group accepts what int() does, digit-separating underscores included
+_MAPPING_ITEM_RE = re.compile(r'(?:^|(?<=,))\s*([+-]?\d+(?:_\d+)*)\s*=([^,]*)')
+_NONALNUM_ASCII_TABLE = str.maketrans(
+    {chr(c): '_' for c in range(128) if not chr(c).isalnum()}
+)
 
-get_media_player_entity_id = lambda name, zone_number, zone_fmt: f"media_player.{make_alphanumeric(name)}_zone_{zone_number:{zone_fmt}}".lower()
+@functools.lru_cache(maxsize=128)
+def make_alphanumeric(input_string):
+    if input_string.isascii():
+        temp = input_string.translate(_NONALNUM_ASCII_TABLE)
+    else:
+        temp = _NONALNUM_RE.sub('_', input_string)
+    return _MULTI_UNDERSCORE_RE.sub('_', temp).strip('_')
+
+def _device_info(device_name: str, client: BaseClient) -> dict:
+    return {
+        "identifiers": {(DOMAIN, device_name)},
+        "name": device_name,
+        "manufacturer": "HTD",
+        "model": client.model.get("name", "Unknown"),
+    }
+
+def _generic_zone_name(zone: int, device_name: str) -> str:
+    if 0 < zone < len(_GENERIC_ZONE_NAMES):
+        return _GENERIC_ZONE_NAMES[zone]
+    return f"Zone {zone} ({device_name})"
+
+def _generic_source_name(source_id: int) -> str:
+    if 0 < source_id < len(_GENERIC_SOURCE_NAMES):
+        return _GENERIC_SOURCE_NAMES[source_id]
+    return f"Source {source_id}"
+
+def _display_source_name(source_id: int, name: str | None) -> str:
+    if not name:
+        return _generic_source_name(source_id)
+    if name.lower() == "unused":
+        return "Unused"
+    return name
+
+class _ResolvedSources:
+    """Source display names and lookups for one controller, shared by its zones."""
+
+    __slots__ = ("names", "source_list", "name_to_id", "raw_to_id", "_sources_map")
+
+    def __init__(self, sources: list[str], sources_map: Mapping[int, str]):
+        self._sources_map = sources_map
+        names: list[str | None] = [None] * (len(sources) + 1)
+        self.name_to_id: dict[str, int] = {}
+        for source_id in range(1, len(sources) + 1):
+            friendly_name = sources_map.get(source_id)
+            if friendly_name is None:
+                friendly_name = _generic_source_name(source_id)
+            if friendly_name:
+                self.name_to_id.setdefault(friendly_name.lower().strip(), source_id)
+            names[source_id] = _display_source_name(source_id, friendly_name)
+        # indexed by source id, slot 0 is unused
+        self.names: tuple[str | None, ...] = tuple(names)
+        # kept as a list since that is what Home Assistant stores and compares
+        # in the entity registry capabilities
+        self.source_list: list[str] = names[1:]
+        self.raw_to_id = {name: i + 1 for i, name in enumerate(sources)}
+
+    def name_for(self, source_id: int) -> str:
+        """Return the display name for a source id, resolving ids outside the table on demand."""
+        if 0 < source_id < len(self.names):
+            return self.names[source_id]
+        friendly_name = self._sources_map.get(source_id)
+        if friendly_name is None:
+            friendly_name = _generic_source_name(source_id)
+        return _display_source_name(source_id, friendly_name)
+
+class _ZoneUpdateDispatcher:
+    """Routes client updates to zone entities and batches their state writes."""
+
+    __slots__ = (
+        "_hass",
+        "_client",
+        "_entities",
+        "_latest",
+        "_pending",
+        "_flush_scheduled",
+    )
+
+    def __init__(self, hass: HomeAssistant, client: BaseClient):
+        self._hass = hass
+        self._client = client
+        self._entities: dict[int, "HtdDevice"] = {}
+        self._latest: dict[int, ZoneDetail] = {}
+        self._pending: dict[int, "HtdDevice"] = {}
+        self._flush_scheduled = False
+
+    async def async_add(self, entity: "HtdDevice") -> None:
+        """Register a zone entity, subscribing to and refreshing the client for the first one."""
+        first = not self._entities
+        self._entities[entity.zone] = entity
+        if first:
+            await self._client.async_subscribe(self._handle_update)
+            self._client.refresh()
+
+        # start from the last status pushed for this zone so the entity is
+        # available before the next push; no snapshot is recorded, so that
+        # push is always written
+        zone_status = self._latest.get(entity.zone)
+        if zone_status is not None:
+            entity.zone_info = zone_status
+
+    async def async_remove(self, entity: "HtdDevice") -> None:
+        """Unregister a zone entity, unsubscribing from the client after the last one."""
+        self._entities.pop(entity.zone, None)
+        self._pending.pop(entity.zone, None)
+        if not self._entities:
+            await self._client.async_unsubscribe(self._handle_update)
+
+    def _handle_update(self, zone_status: ZoneDetail) -> None:
+        self._latest[zone_status.zone] = zone_status
+        entity = self._entities.get(zone_status.zone)
+        if entity is None or not entity.apply_zone_status(zone_status):
+            return
+        self._pending[zone_status.zone] = entity
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self._hass.loop.call_soon(self._flush)
+
+    def _flush(self) -> None:
+        """Write every zone changed since the last flush in one pass."""
+        self._flush_scheduled = False
+        pending = self._pending
+        self._pending = {}
+        for entity in pending.values():
+            entity.async_write_ha_state()
+
+def get_media_player_entity_id(name, zone_number, zone_fmt):
+    zone = f"{zone_number:02d}" if zone_fmt == "02" else str(zone_number)
+    return f"media_player.{make_alphanumeric(name)}_zone_{zone}".lower()
 
 def _parse_mapping(option_value: str) -> dict[int, str]:
     """Parse a JSON or comma-separated mapping string into a dict."""
     if not option_value:
         return {}
-    try:
-        parsed = json.loads(option_value)
-        return {int(k): str(v) for k, v in parsed.items()}
-    except Exception:
-        mapping = {}
-        for item in option_value.split(","):
-            if "=" in item:
-                k, v = item.split("=", 1)
-                try:
-                    mapping[int(k.strip())] = v.strip()
-                except ValueError:
-                    continue
-        return mapping
+    stripped = option_value.lstrip()
+    if stripped and stripped[0] in "{[":
+        try:
+            parsed = _loads(option_value)
+            return {int(k): str(v) for k, v in parsed.items()}
+        except Exception:
+            pass
+    return {int(k): v.strip() for k, v in _MAPPING_ITEM_RE.findall(option_value)}
 
 async def async_setup_platform(hass, _, async_add_entities, __=None):
     htd_configs = hass.data[DOMAIN]
     entities = []
+    sources_cache: dict[int, _ResolvedSources] = {}
 
     for config in htd_configs:
         unique_id = config[CONF_UNIQUE_ID]
@@ -74,23 +219,35 @@ async def async_setup_platform(hass, _, async_add_entities, __=None):
 
         zone_count = client.get_zone_count()
         source_count = client.get_source_count()
-        sources = [f"Source {i + 1}" for i in range(source_count)]
+        # entities only read the resolved sources, so devices with the same
+        # source count can share them
+        resolved_sources = sources_cache.get(source_count)
+        if resolved_sources is None:
+            sources = [_generic_source_name(i) for i in range(1, source_count + 1)]
+            resolved_sources = _ResolvedSources(sources, _EMPTY_MAPPING)
+            sources_cache[source_count] = resolved_sources
+        zone_fmt = "02" if client.model["zones"] > 10 else "01"
+        dispatcher = _ZoneUpdateDispatcher(hass, client)
+        device_info = _device_info(device_name, client)
 
         for zone in range(1, zone_count + 1):
             entity = HtdDevice(
-                unique_id,
-                device_name,
-                zone,
-                sources,
-                client,
-                {}
+                unique_id=unique_id,
+                device_name=device_name,
+                entity_id=get_media_player_entity_id(device_name, zone, zone_fmt),
+                zone=zone,
+                client=client,
+                zones_map=_EMPTY_MAPPING,
+                resolved_sources=resolved_sources,
+                dispatcher=dispatcher,
+                device_info=device_info,
             )
             entities.append(entity)
 
     async_add_entities(entities)
     return True
 
-async def async_setup_entry(_: HomeAssistant, config_entry: HtdClientConfigEntry, async_add_entities):
+async def async_setup_entry(hass: HomeAssistant, config_entry: HtdClientConfigEntry, async_add_entities):
     entities = []
 
     client = config_entry.runtime_data
@@ -98,19 +255,26 @@ async def async_setup_entry(_: HomeAssistant, config_entry: HtdClientConfigEntry
     source_count = client.get_source_count()
     device_name = config_entry.title
     unique_id = config_entry.data.get(CONF_UNIQUE_ID)
-    sources = [f"Source {i + 1}" for i in range(source_count)]
+    sources = [_generic_source_name(i) for i in range(1, source_count + 1)]
 
     zones_map = _parse_mapping(config_entry.options.get(CONF_ZONES, ""))
     sources_map = _parse_mapping(config_entry.options.get(CONF_SOURCES, ""))
+    resolved_sources = _ResolvedSources(sources, sources_map)
+    zone_fmt = "02" if client.model["zones"] > 10 else "01"
+    dispatcher = _ZoneUpdateDispatcher(hass, client)
+    device_info = _device_info(device_name, client)
 
     for zone in range(1, zone_count + 1):
         entity = HtdDevice(
-            unique_id,
-            device_name,
-            zone,
-            sources,
-            client,
-            {"zones": zones_map, "sources": sources_map}
+            unique_id=unique_id,
+            device_name=device_name,
+            entity_id=get_media_player_entity_id(device_name, zone, zone_fmt),
+            zone=zone,
+            client=client,
+            zones_map=zones_map,
+            resolved_sources=resolved_sources,
+            dispatcher=dispatcher,
+            device_info=device_info,
         )
         entities.append(entity)
 
@@ -119,84 +283,84 @@ async def async_setup_entry(_: HomeAssistant, config_entry: HtdClientConfigEntry
 class HtdDevice(MediaPlayerEntity):
     """Representation of an HTD zone as a Home Assistant media player entity."""
 
-    should_poll = False
-
-    def __init__(self, unique_id: str, device_name: str, zone: int, sources: list[str], client: BaseClient, mappings: dict):
-        self._unique_id = f"{unique_id}_{zone:02}"
-        self.device_name = device_name
+    __slots__ = (
+        "zone",
+        "client",
+        "zone_info",
+        "_last_snapshot",
+        "_dispatcher",
+        "_name",
+        "_resolved_sources",
+    )
+
+    _attr_should_poll = False
+    _attr_supported_features = SUPPORT_HTD
+    _attr_volume_step = _INV_MAX_VOLUME
+
+    def __init__(
+        self,
+        unique_id: str,
+        device_name: str,
+        entity_id: str,
+        zone: int,
+        client: BaseClient,
+        zones_map: Mapping[int, str],
+        resolved_sources: _ResolvedSources,
+        dispatcher: _ZoneUpdateDispatcher,
+        device_info: dict,
+    ):
+        self._attr_unique_id = f"{unique_id}_{zone:02}"
         self.zone = zone
         self.client = client
-        self.sources = sources
-        self.zones_map = mappings.get("zones", {})
-        self.sources_map = mappings.get("sources", {})
-        zone_fmt = "02" if self.client.model["zones"] > 10 else "01"
-        self.entity_id = get_media_player_entity_id(device_name, zone, zone_fmt)
+        self.entity_id = entity_id
+        self._attr_device_info = device_info
         self.zone_info: ZoneDetail | None = None
+        self._last_snapshot: tuple | None = None
+        self._dispatcher = dispatcher
 
-    @property
-    def unique_id(self) -> str:
-        return self._unique_id
-
-    @property
-    def device_info(self) -> dict:
-        """Return device info for grouping zones under the HTD device."""
-        return {
-            "identifiers": {(DOMAIN, self.device_name)},
-            "name": self.device_name,
-            "manufacturer": "HTD",
-            "model": self.client.model.get("name", "Unknown"),
-        }
+        name = zones_map.get(zone)
+        if name is None:
+            name = _generic_zone_name(zone, device_name)
+        self._name = None if not name or name.lower() == "unused" else name
 
-    @property
-    def supported_features(self) -> int:
-        return SUPPORT_HTD
+        self._resolved_sources = resolved_sources
 
     @property
     def name(self) -> str | None:
         """Return friendly zone name if available, hide if 'Unused'."""
-        name = self.zones_map.get(
-            self.zone,
-            GENERIC_ZONE_NAMES.get(self.zone, f"Zone {self.zone} ({self.device_name})")
-        )
-        if not name or name.lower() == "unused":
-            return None
-        return name
+        return self._name
 
-    def update(self) -> None:
+    async def async_update(self) -> None:
         """Manual polling update — fetches zone info directly from client."""
         zone_status = self.client.get_zone(self.zone)
         if zone_status:
-            self._do_update(zone_status)
-        else:
-            self._attr_state = STATE_UNKNOWN
+            self.apply_zone_status(zone_status)
 
     @property
     def state(self) -> str:
         if not self.client.connected:
             return STATE_UNAVAILABLE
-        if self.zone_info is None:
+        zone_info = self.zone_info
+        if zone_info is None:
             return STATE_UNKNOWN
-        return STATE_ON if self.zone_info.power else STATE_OFF
+        return _POWER_STATES[bool(zone_info.power)]
 
     @property
     def available(self) -> bool:
         """Return True if client is ready and zone info is available."""
-        return self.client.ready and self.zone_info is not None
+        return self.zone_info is not None and self.client.ready
 
     # --- Volume controls ---
-    @property
-    def volume_step(self) -> float:
-        return 1 / HtdConstants.MAX_VOLUME
-
     @property
     def volume_level(self) -> float | None:
-        if not self.zone_info:
+        zone_info = self.zone_info
+        if zone_info is None:
             return None
-        return self.zone_info.volume / HtdConstants.MAX_VOLUME
+        return zone_info.volume * _INV_MAX_VOLUME
 
     async def async_set_volume_level(self, volume: float) -> None:
         """Set volume level (0.0–1.0 normalized)."""
-        converted_volume = int(volume * HtdConstants.MAX_VOLUME)
+        converted_volume = int(volume * _MAX_VOLUME)
         _LOGGER.debug(
             "Setting volume for zone %d: normalized=%.2f, raw=%d",
             self.zone,
@@ -229,9 +393,10 @@ class HtdDevice(MediaPlayerEntity):
     # --- Mute controls ---
     @property
     def is_volume_muted(self) -> bool | None:
-        if not self.zone_info:
+        zone_info = self.zone_info
+        if zone_info is None:
             return None
-        return self.zone_info.mute
+        return zone_info.mute
 
     async def async_mute_volume(self, mute: bool) -> None:
         """Mute or unmute the zone."""
@@ -244,36 +409,15 @@ class HtdDevice(MediaPlayerEntity):
     # --- Source handling ---
     @property
     def source(self) -> str | None:
-        if not self.zone_info:
+        zone_info = self.zone_info
+        if zone_info is None:
             return None
-        source_id = self.zone_info.source
-        name = self.sources_map.get(
-            source_id,
-            GENERIC_SOURCE_NAMES.get(source_id, f"Source {source_id}")
-        )
-        if not name:
-            return f"Source {source_id}"
-        if name.lower() == "unused":
-            return "Unused"
-        return name
+        return self._resolved_sources.name_for(zone_info.source)
 
     @property
     def source_list(self) -> list[str]:
         """Return list of available sources, including 'Unused' placeholders."""
-        source_list = []
-        for i in range(len(self.sources)):
-            source_id = i + 1
-            name = self.sources_map.get(
-                source_id,
-                GENERIC_SOURCE_NAMES.get(source_id, f"Source {source_id}")
-            )
-            if not name:
-                name = f"Source {source_id}"
-            if name.lower() == "unused":
-                source_list.append("Unused")
-            else:
-                source_list.append(name)
-        return source_list
+        return self._resolved_sources.source_list
 
     @property
     def media_title(self) -> str | None:
@@ -282,20 +426,16 @@ class HtdDevice(MediaPlayerEntity):
 
     async def async_select_source(self, source: str) -> None:
         """Allow selecting source by friendly name or raw string."""
-        for source_id in range(1, len(self.sources) + 1):
-            friendly_name = self.sources_map.get(
-                source_id,
-                GENERIC_SOURCE_NAMES.get(source_id, f"Source {source_id}")
-            )
-            if friendly_name and friendly_name.lower().strip() == source.lower().strip():
-                _LOGGER.debug("Zone %d select_source requested: %s (id=%d)", self.zone, friendly_name, source_id)
-                await self.client.async_set_source(self.zone, source_id)
-                return
-
-        if source in self.sources:
-            source_index = self.sources.index(source)
-            _LOGGER.debug("Zone %d select_source requested: %s (raw index=%d)", self.zone, source, source_index + 1)
-            await self.client.async_set_source(self.zone, source_index + 1)
+        source_id = self._resolved_sources.name_to_id.get(source.lower().strip())
+        if source_id is not None:
+            _LOGGER.debug("Zone %d select_source requested: %s (id=%d)", self.zone, source, source_id)
+            await self.client.async_set_source(self.zone, source_id)
+            return
+
+        source_id = self._resolved_sources.raw_to_id.get(source)
+        if source_id is not None:
+            _LOGGER.debug("Zone %d select_source requested: %s (raw index=%d)", self.zone, source, source_id)
+            await self.client.async_set_source(self.zone, source_id)
             return
 
         _LOGGER.warning("Zone %d unknown source selection: %s. Available sources: %s", self.zone, source, self.source_list)
@@ -303,59 +443,55 @@ class HtdDevice(MediaPlayerEntity):
     # --- Subscription handling ---
     async def async_added_to_hass(self) -> None:
         """Subscribe to HTD client updates when entity is added."""
-        await self.client.async_subscribe(self._do_update)
-        self.client.refresh()
-        self.update()  # ensure initial state is set immediately
+        # a re-added entity must write the first push it sees
+        self._last_snapshot = None
+        await self._dispatcher.async_add(self)
 
     async def async_will_remove_from_hass(self) -> None:
         """Unsubscribe from HTD client updates when entity is removed."""
-        await self.client.async_unsubscribe(self._do_update)
-
-    def _do_update(self, zone_status: ZoneDetail) -> None:
-        """Handle updates from HTD client and refresh entity state."""
-        if zone_status.zone != self.zone:
-            return
-
-        normalized_volume = zone_status.volume / HtdConstants.MAX_VOLUME
-        source_name = self.sources_map.get(
-            zone_status.source,
-            GENERIC_SOURCE_NAMES.get(zone_status.source, f"Source {zone_status.source}")
-        )
-        if not source_name:
-            source_name = f"Source {zone_status.source}"
-        elif source_name.lower() == "unused":
-            source_name = "Unused"
-
-        if not self.client.connected:
-            self._attr_state = STATE_UNAVAILABLE
-        else:
-            self._attr_state = STATE_ON if zone_status.power else STATE_OFF
-
-        _LOGGER.debug(
-            "Zone %d updated: power=%s, volume=%d (normalized=%.2f), source=%d (%s), mute=%s",
-            zone_status.zone,
+        await self._dispatcher.async_remove(self)
+
+    def apply_zone_status(self, zone_status: ZoneDetail) -> bool:
+        """Apply a zone update from the client, returning True if the state needs writing."""
+        # every input the published properties read (state, available, volume,
+        # mute, source and the raw attributes) is in here, so an unchanged
+        # snapshot means nothing visible changed
+        snapshot = (
             zone_status.power,
             zone_status.volume,
-            normalized_volume,
             zone_status.source,
-            source_name,
             zone_status.mute,
+            self.client.connected,
+            self.client.ready,
         )
+        if snapshot == self._last_snapshot:
+            return False
+        self._last_snapshot = snapshot
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Zone %d updated: power=%s, volume=%d (normalized=%.2f), source=%d (%s), mute=%s",
+                zone_status.zone,
+                zone_status.power,
+                zone_status.volume,
+                zone_status.volume * _INV_MAX_VOLUME,
+                zone_status.source,
+                self._resolved_sources.name_for(zone_status.source),
+                zone_status.mute,
+            )
 
         self.zone_info = zone_status
-        self._attr_volume_level = normalized_volume
-        self._attr_is_volume_muted = zone_status.mute
-        self._attr_source = source_name
-        self.async_write_ha_state()
+        return True
 
     @property
     def extra_state_attributes(self) -> dict:
         """Expose raw and friendly HTD values for debugging/power users."""
-        if not self.zone_info:
+        zone_info = self.zone_info
+        if zone_info is None:
             return {}
         return {
-            "raw_volume": self.zone_info.volume,
-            "raw_source_id": self.zone_info.source,
+            "raw_volume": zone_info.volume,
+            "raw_source_id": zone_info.source,
             "friendly_zone_name": self.name,
             "friendly_source_name": self.source,
         }
\ No newline at end of file